@@ -3,7 +3,7 @@
 gmx2pdb_strip.py
 
 Description:
-    Convert GROMACS .gro structures to PDB, then filter the resulting PDB to include only:
+    Convert GROMACS .gro structures to PDB, filtering in the same pass to include only:
       - Standard amino acid residues
       - Palmitoylated cysteine backbone atoms (CYSP)
       - Zinc ions (ZN)
@@ -17,59 +17,116 @@ Usage:
         -o, --output   Path for the filtered PDB output (default: align-ready.pdb)
 
 Requirements:
-    - GROMACS CLI (`gmx`), with either `gmx2pdb` or `editconf` available
-    - Biopython (install via `pip install biopython`)
+    - Python 3 (standard library only)
 
 Examples:
     python gmx2pdb_select.py -i pre_prod.gro -o pre_align_ready.pdb
     python gmx2pdb_select.py -i post_prod.gro -o post_align_ready.pdb
 """
 
-import os
-import subprocess
 import argparse
-from Bio.PDB import PDBParser, PDBIO, Select
 
-class ProteinSelect(Select):
+class ProteinSelect:
     # Standard amino acids
     standard_aa = {"ALA", "ARG", "ASN", "ASP", "CYS", "GLN", "GLU", "GLY", "HIS", "ILE", "LEU", "LYS", "MET", "PHE", "PRO", "SER", "THR", "TRP", "TYR", "VAL"}
-
-    def accept_atom(self, atom):
-        residue = atom.get_parent()
-        res_id = residue.get_id()
-        # Protein residues
-        if res_id[0] == " ":
-            if residue.resname in self.standard_aa:
+    # Atoms kept for palmitoylated cysteine (CYSP)
+    _CYSP_ATOMS = frozenset({"N", "CA", "C", "O", "CB", "SG"})
+
+    @classmethod
+    def is_standard(cls, resname):
+        """
+        True for standard amino acids, including four-letter GROMACS protonation
+        states (HISE, HISD, LYSH, ASPH, ...), which are matched by their first three letters.
+        """
+        return resname != "CYSP" and resname[:3] in cls.standard_aa
+
+    @classmethod
+    def accept_record(cls, record, resname, atom_name):
+        """
+        Selection applied to raw PDB record fields: standard amino acids (see is_standard),
+        the CYSP backbone, CB and SG atoms, and zinc ions.
+        """
+        if record == "ATOM":
+            if cls.is_standard(resname):
                 return True
-            if residue.resname == "CYSP":
-                return atom.name in ["N", "CA", "C", "O", "CB", "SG"]
-            return False
-        # Heteroatoms: include only zinc ions
-        if res_id[0].startswith("H_"):
-            return residue.resname == "ZN" and atom.name == "ZN"
+            return resname == "CYSP" and atom_name in cls._CYSP_ATOMS
+        if record == "HETATM":
+            return resname == "ZN" and atom_name == "ZN"
         return False
 
 
-def run_gmx_convert(input_gro, output_pdb):
+def gro_field_width(line):
+    """
+    Returns the coordinate field width of a .gro atom line. Like GROMACS, this is the
+    distance between the first two decimal points, so files written with extra
+    precision (e.g. %9.4f) are read correctly. Defaults to 8 (%8.3f).
+    """
+    p1 = line.find(".", 20)
+    p2 = line.find(".", p1 + 1) if p1 != -1 else -1
+    return p2 - p1 if p2 != -1 else 8
+
+
+def read_gro(input_gro):
     """
-    Converts a GROMACS .gro file to PDB using gmx editconf (or gmx2pdb if available).
+    Yields (resid, resname, atom_name, x, y, z) for each atom of a GROMACS .gro file.
+    Coordinates are converted from nm to Angstrom.
     """
-    # Try using gmx2pdb first
-    cmd = ["gmx", "gmx2pdb", "-f", input_gro, "-o", output_pdb]
-    try:
-        subprocess.run(cmd, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # Fallback to editconf
-        cmd = ["gmx", "editconf", "-f", input_gro, "-o", output_pdb]
-        subprocess.run(cmd, check=True)
+    with open(input_gro) as fi:
+        fi.readline()  # Title line
+        n_atoms = int(fi.readline())
+        width = 8
+        for i in range(n_atoms):
+            line = fi.readline()
+            # The first atom line sets the precision for the whole file
+            if i == 0:
+                width = gro_field_width(line)
+            x, y, z = (float(line[20 + k * width:20 + (k + 1) * width]) * 10 for k in range(3))
+            yield (int(line[0:5]), line[5:10].strip(), line[10:15].strip(), x, y, z)
+
+
+def pdb_record(resname):
+    """
+    Returns the PDB record type for a residue: ATOM for protein, HETATM for anything else.
+    """
+    return "ATOM" if ProteinSelect.is_standard(resname) or resname == "CYSP" else "HETATM"
 
 
-def filter_structure(input_pdb, output_pdb):
-    parser = PDBParser(QUIET=True)
-    structure = parser.get_structure(os.path.basename(input_pdb), input_pdb)
-    io = PDBIO()
-    io.set_structure(structure)
-    io.save(output_pdb, ProteinSelect())
+def pdb_element(resname, atom_name):
+    """
+    Guesses the element symbol of an atom from its name.
+    """
+    # Single-atom ion residues (ZN, NA, CL, ...) are named after their element
+    if resname == atom_name and len(atom_name) == 2:
+        return atom_name
+    return atom_name.lstrip("0123456789")[:1]
+
+
+def pdb_atom_line(serial, resid, resname, atom_name, x, y, z):
+    """
+    Formats one atom as a fixed-column PDB ATOM/HETATM record, including the element column.
+    Names are truncated to four characters, as gmx does, so the columns never shift.
+    """
+    record = pdb_record(resname)
+    element = pdb_element(resname, atom_name)
+    # Two-letter elements start in column 13, other names shorter than four characters in column 14
+    name = atom_name if len(element) == 2 or len(atom_name) >= 4 else " " + atom_name
+    return "%-6s%5d %-4.4s %-4.4s %4d    %8.3f%8.3f%8.3f  1.00  0.00          %2s\n" % (
+        record, serial % 100000, name, resname, resid % 10000, x, y, z, element)
+
+
+def strip_gro(input_gro, output_pdb):
+    """
+    Converts a .gro file and filters it in a single pass, writing only the selected
+    atoms to output_pdb with no intermediate PDB on disk.
+    """
+    serial = 0
+    with open(output_pdb, "w") as fo:
+        for atom in read_gro(input_gro):
+            resname, atom_name = atom[1], atom[2]
+            if ProteinSelect.accept_record(pdb_record(resname), resname, atom_name):
+                serial += 1
+                fo.write(pdb_atom_line(serial, *atom))
+        fo.write("TER\nEND\n")
 
 
 def main():
@@ -78,17 +135,9 @@ def main():
     parser.add_argument("-o", "--output", default="align-ready.pdb", help="Filtered PDB output")
     args = parser.parse_args()
 
-    gro_file = args.input
-    temp_pdb = "temp_conv.pdb"
-
-    print(f"Converting {gro_file} -> {temp_pdb}...")
-    run_gmx_convert(gro_file, temp_pdb)
-
-    print(f"Filtering atoms and writing to {args.output}...")
-    filter_structure(temp_pdb, args.output)
+    print(f"Converting and filtering {args.input} -> {args.output}...")
+    strip_gro(args.input, args.output)
 
-    # Clean up
-    os.remove(temp_pdb)
     print("Done.")
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the CSV file into a DataFrame with the correct delimiter
-df = pd.read_csv('rg-over-time-protein.csv', sep='\s+')
+df = pd.read_csv('rg-over-time-protein.csv', sep=r'\s+')
 
 # Verify column names
 print(df.columns)
@@ -12,21 +12,21 @@ print(df.columns)
 # Define the list of replicate columns
 rg_cols = ['R1', 'R2', 'R3', 'R4', 'R5', 'R6', 'R7', 'R8', 'R9', 'R10']
 
-# Melt the DataFrame to long format for easier plotting with Seaborn
-melted_df = df.melt(id_vars=['Time (ps)'], value_vars=rg_cols, 
-                    var_name='Replicate', value_name='Rg')
+# Replicate values as a (time, replicate) array, shared by the plots and statistics below
+arr = df[rg_cols].to_numpy()
 
 # Plot Rg over time for all replicates
 plt.figure(figsize=(10, 6))
-sns.lineplot(data=melted_df, x='Time (ps)', y='Rg', hue='Replicate')
+plt.plot(df['Time (ps)'].to_numpy(), arr, label=rg_cols)
+plt.legend(title='Replicate')
 plt.title('Radius of Gyration (Rg) for Each Replicate')
 plt.xlabel('Time (ps)')
 plt.ylabel('Rg (nm)')
 plt.show()
 
 # Compute mean and standard deviation across replicates at each time point
-df['Mean'] = df[rg_cols].mean(axis=1)
-df['Std'] = df[rg_cols].std(axis=1)
+df['Mean'] = np.nanmean(arr, axis=1)
+df['Std'] = np.nanstd(arr, axis=1, ddof=1)
 
 # Plot mean Rg with standard deviation as a shaded band
 plt.figure(figsize=(10, 6))
@@ -43,12 +43,12 @@ plt.show()
 total_time = df['Time (ps)'].max()
 equil_start = total_time / 2  # Starts at 75 ps for 150 ps total
 
-# Filter the DataFrame for the equilibrated phase
-equil_df = df[df['Time (ps)'] > equil_start]
+# Select the rows of the equilibrated phase
+equil_arr = arr[(df['Time (ps)'] > equil_start).to_numpy()]
 
 # Compute mean and standard deviation for each replicate in the equilibrated phase
-equil_means = equil_df[rg_cols].mean()
-equil_stds = equil_df[rg_cols].std()
+equil_means = pd.Series(np.nanmean(equil_arr, axis=0), index=rg_cols)
+equil_stds = pd.Series(np.nanstd(equil_arr, axis=0, ddof=1), index=rg_cols)
 
 # Print equilibrated phase statistics
 print("Equilibrated Radius of Gyration (Rg):")
@@ -63,10 +63,14 @@ plt.ylabel('Rg (nm)')
 plt.show()
 
 # Compute correlation matrix of Rg across replicates
-corr_matrix = df[rg_cols].corr()
+# np.corrcoef cannot skip gaps, so fall back to pandas' pairwise-complete corr() when values are missing
+if np.isnan(arr).any():
+    corr_matrix = df[rg_cols].corr().to_numpy()
+else:
+    corr_matrix = np.corrcoef(arr, rowvar=False)
 
 # Plot heatmap of the correlation matrix
 plt.figure(figsize=(8, 6))
-sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', vmin=-1, vmax=1)
+sns.heatmap(corr_matrix, xticklabels=rg_cols, yticklabels=rg_cols, annot=True, cmap='coolwarm', vmin=-1, vmax=1)
 plt.title('Correlation Matrix of Radius of Gyration (Rg) Across Replicates')
 plt.show()
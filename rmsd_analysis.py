@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 
 # Load the CSV file into a DataFrame
-df = pd.read_csv('rmsd-over-time-backbone.csv')
+df = pd.read_csv('rmsd-over-time-backbone.csv', skipinitialspace=True)
 
 # Strip any leading/trailing whitespace from column names
 df.columns = df.columns.str.strip()
@@ -15,21 +15,21 @@ df.rename(columns={'Time (ps)': 'Time'}, inplace=True)
 # Define the list of replicate columns
 rmsd_cols = ['R1', 'R2', 'R3', 'R4', 'R5', 'R6', 'R7', 'R8', 'R9', 'R10']
 
-# Melt the DataFrame to long format for easier plotting with Seaborn
-melted_df = df.melt(id_vars=['Time'], value_vars=rmsd_cols, 
-                    var_name='Replicate', value_name='RMSD')
+# Replicate values as a (time, replicate) array, shared by the plots and statistics below
+arr = df[rmsd_cols].to_numpy()
 
 # Plot RMSD over time for all replicates
 plt.figure(figsize=(10, 6))
-sns.lineplot(data=melted_df, x='Time', y='RMSD', hue='Replicate')
+plt.plot(df['Time'].to_numpy(), arr, label=rmsd_cols)
+plt.legend(title='Replicate')
 plt.title('Backbone RMSD for Each Replicate')
 plt.xlabel('Time (ps)')
 plt.ylabel('RMSD (nm)')
 plt.show()
 
 # Compute mean and standard deviation across replicates at each time point
-df['Mean'] = df[rmsd_cols].mean(axis=1)
-df['Std'] = df[rmsd_cols].std(axis=1)
+df['Mean'] = np.nanmean(arr, axis=1)
+df['Std'] = np.nanstd(arr, axis=1, ddof=1)
 
 # Plot mean RMSD with standard deviation as a shaded band
 plt.figure(figsize=(10, 6))
@@ -46,12 +46,12 @@ plt.show()
 total_time = df['Time'].max()
 equil_start = total_time / 2  # Starts at 75 ps for 150 ps total
 
-# Filter the DataFrame for the equilibrated phase
-equil_df = df[df['Time'] > equil_start]
+# Select the rows of the equilibrated phase
+equil_arr = arr[(df['Time'] > equil_start).to_numpy()]
 
 # Compute mean and standard deviation for each replicate in the equilibrated phase
-equil_means = equil_df[rmsd_cols].mean()
-equil_stds = equil_df[rmsd_cols].std()
+equil_means = pd.Series(np.nanmean(equil_arr, axis=0), index=rmsd_cols)
+equil_stds = pd.Series(np.nanstd(equil_arr, axis=0, ddof=1), index=rmsd_cols)
 
 # Print equilibrated phase statistics
 print("Equilibrated Backbone RMSD:")
@@ -66,10 +66,14 @@ plt.ylabel('RMSD (nm)')
 plt.show()
 
 # Compute correlation matrix of RMSD across replicates
-corr_matrix = df[rmsd_cols].corr()
+# np.corrcoef cannot skip gaps, so fall back to pandas' pairwise-complete corr() when values are missing
+if np.isnan(arr).any():
+    corr_matrix = df[rmsd_cols].corr().to_numpy()
+else:
+    corr_matrix = np.corrcoef(arr, rowvar=False)
 
 # Plot heatmap of the correlation matrix
 plt.figure(figsize=(8, 6))
-sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', vmin=-1, vmax=1)
+sns.heatmap(corr_matrix, xticklabels=rmsd_cols, yticklabels=rmsd_cols, annot=True, cmap='coolwarm', vmin=-1, vmax=1)
 plt.title('Correlation Matrix of Backbone RMSD Across Replicates')
 plt.show()